@@ -212,6 +212,22 @@ def freeze(x):
     return x
 
 
+def copy_data(x):
+    """Returns a deep copy of word data made of dicts, lists, tuples and
+    sets of scalar values.  This is much faster than copy.deepcopy() for
+    such data; other objects are not copied."""
+    t = type(x)
+    if t is dict:
+        return {k: copy_data(v) for k, v in x.items()}
+    if t is list:
+        return [copy_data(v) for v in x]
+    if t is tuple:
+        return tuple(copy_data(v) for v in x)
+    if t is set:
+        return set(x)
+    return x
+
+
 def ns_title_prefix_tuple(
     wxr, namespace: str, lower: bool = False
 ) -> tuple[str, ...]:
@@ -187,11 +187,7 @@ def process_form_of_list_item(
                     elif sense_word in POS_SECTIONS:
                         pos_data = POS_SECTIONS[sense_word]
                     elif sense_word in GRAMMATICAL_TAGS:
-                        tr_tag = GRAMMATICAL_TAGS[sense_word]
-                        if isinstance(tr_tag, str):
-                            sense.tags.append(tr_tag)
-                        elif isinstance(tr_tag, list):
-                            sense.tags.extend(tr_tag)
+                        sense.tags.extend(GRAMMATICAL_TAGS[sense_word])
                 if len(pos_data) > 0 and word_entry.pos == "unknown":
                     word_entry.pos = pos_data["pos"]
                     word_entry.tags.extend(pos_data.get("tags", []))
@@ -1,3 +1,6 @@
+import functools
+import sys
+
 from .models import WordEntry
 
 # Sense tags
@@ -326,20 +329,28 @@ INFLECTION_TABLE_TAGS = {
     "Hauptsatzkonjugation": "main-clause",
 }
 
+# Values are normalized to tuples so callers can always extend with them,
+# and interned so every entry's tag list shares the same string objects.
 GRAMMATICAL_TAGS = {
-    **K_TEMPLATE_TAGS,
-    **GENDER_TAGS,
-    **NUMBER_TAGS,
-    **CASE_TAGS,
-    **COMPARISON_TAGS,
-    **DECLENSION_TAGS,
-    **OTHER_TAGS,
-    **TENSE_TAGS,
-    **MOOD_TAGS,
-    **VERB_FORM_TAGS,
-    **VOICE_TAGS,
-    **PERSON_TAGS,
-    **INFLECTION_TABLE_TAGS,
+    sys.intern(raw_tag): tuple(
+        map(sys.intern, (tag,) if isinstance(tag, str) else tag)
+    )
+    for tag_dict in (
+        K_TEMPLATE_TAGS,
+        GENDER_TAGS,
+        NUMBER_TAGS,
+        CASE_TAGS,
+        COMPARISON_TAGS,
+        DECLENSION_TAGS,
+        OTHER_TAGS,
+        TENSE_TAGS,
+        MOOD_TAGS,
+        VERB_FORM_TAGS,
+        VOICE_TAGS,
+        PERSON_TAGS,
+        INFLECTION_TABLE_TAGS,
+    )
+    for raw_tag, tag in tag_dict.items()
 }
 
 K_TEMPLATE_TOPICS = {
@@ -386,23 +397,50 @@ K_TEMPLATE_TOPICS = {
     "Theoretische Informatik": "computing",
 }
 
+_MISSING = object()
 
-def translate_raw_tags(data: WordEntry) -> None:
-    raw_tags = []
-    for raw_tag in data.raw_tags:
-        if raw_tag in GRAMMATICAL_TAGS:
-            tag = GRAMMATICAL_TAGS[raw_tag]
-            if isinstance(tag, str):
-                data.tags.append(tag)
-            elif isinstance(tag, list):
-                data.tags.extend(tag)
-        elif raw_tag in K_TEMPLATE_TOPICS and hasattr(data, "topics"):
-            topic = K_TEMPLATE_TOPICS[raw_tag]
-            if isinstance(topic, str):
-                data.topics.append(topic)
-            elif isinstance(topic, dict):
-                data.topics.append(topic.get("topic"))
-                data.tags.append(topic.get("tag"))
+
+@functools.lru_cache(maxsize=4096)
+def _translate_raw_tags(
+    raw_tags: tuple[str, ...], has_topics: bool
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Return `(tags, topics, remaining_raw_tags)` for a raw tag sequence.
+    The tables are static, so results are cached on the raw tags."""
+    tags = []
+    topics = []
+    remaining = []
+    for raw_tag in raw_tags:
+        # Raw tags are matched exactly, so a dict lookup beats a compiled
+        # alternation of all keys; a regex would only pay off for prefix or
+        # substring matching.
+        tr_tags = GRAMMATICAL_TAGS.get(raw_tag)
+        if tr_tags is not None:
+            tags.extend(tr_tags)
+            continue
+        topic = K_TEMPLATE_TOPICS.get(raw_tag, _MISSING)
+        if topic is not _MISSING and has_topics:
+            topic_type = type(topic)
+            if topic_type is str:
+                topics.append(topic)
+            elif topic_type is dict:
+                topics.append(topic.get("topic"))
+                tags.append(topic.get("tag"))
         else:
-            raw_tags.append(raw_tag)
-    data.raw_tags = raw_tags
+            remaining.append(raw_tag)
+    return tuple(tags), tuple(topics), tuple(remaining)
+
+
+def translate_raw_tags(data: WordEntry) -> None:
+    has_topics = hasattr(data, "topics")
+    tags, topics, raw_tags = _translate_raw_tags(
+        tuple(data.raw_tags), has_topics
+    )
+    data.tags.extend(tags)
+    if has_topics:
+        data.topics.extend(topics)
+    # Skip the validated assignment when no raw tag was translated and
+    # clear in place when all of them were.
+    if len(raw_tags) == 0:
+        data.raw_tags.clear()
+    elif len(raw_tags) != len(data.raw_tags):
+        data.raw_tags = list(raw_tags)
@@ -6,13 +6,13 @@ import copy
 import html
 import re
 import sys
+import unicodedata
 from collections import defaultdict
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Iterable,
-    Iterator,
     Optional,
     Set,
     Union,
@@ -31,6 +31,7 @@ from wikitextprocessor.parser import (
 
 from ...clean import clean_template_args, clean_value
 from ...datautils import (
+    copy_data,
     data_append,
     data_extend,
     ns_title_prefix_tuple,
@@ -62,7 +63,6 @@ from .info_templates import (
     parse_info_template_node,
 )
 from .linkages import parse_linkage_item_text
-from .parts_of_speech import PARTS_OF_SPEECH
 from .section_titles import (
     COMPOUNDS_TITLE,
     DESCENDANTS_TITLE,
@@ -82,7 +82,6 @@ from .type_utils import (
     FormData,
     LinkageData,
     SenseData,
-    SoundData,
     TemplateData,
     WordData,
 )
@@ -92,194 +91,229 @@ from .unsupported_titles import unsupported_title_map
 # might return 'taxonomic' which is English text 99% of the time.
 ENGLISH_TEXTS = ("english", "taxonomic")
 
-# Matches head tag
-HEAD_TAG_RE = re.compile(
-    r"^(head|Han char|arabic-noun|arabic-noun-form|"
-    r"hangul-symbol|syllable-hangul)$|"
-    + r"^(latin|"
-    + "|".join(lang_code for lang_code, *_ in get_all_names("en"))
-    + r")-("
-    + "|".join(
-        [
-            "abbr",
-            "adj",
-            "adjective",
-            "adjective form",
-            "adjective-form",
-            "adv",
-            "adverb",
-            "affix",
-            "animal command",
-            "art",
-            "article",
-            "aux",
-            "bound pronoun",
-            "bound-pronoun",
-            "Buyla",
-            "card num",
-            "card-num",
-            "cardinal",
-            "chunom",
-            "classifier",
-            "clitic",
-            "cls",
-            "cmene",
-            "cmavo",
-            "colloq-verb",
-            "colverbform",
-            "combining form",
-            "combining-form",
-            "comparative",
-            "con",
-            "concord",
-            "conj",
-            "conjunction",
-            "conjug",
-            "cont",
-            "contr",
-            "converb",
-            "daybox",
-            "decl",
-            "decl noun",
-            "def",
-            "dem",
-            "det",
-            "determ",
-            "Deva",
-            "ending",
-            "entry",
-            "form",
-            "fuhivla",
-            "gerund",
-            "gismu",
-            "hanja",
-            "hantu",
-            "hanzi",
-            "head",
-            "ideophone",
-            "idiom",
-            "inf",
-            "indef",
-            "infixed pronoun",
-            "infixed-pronoun",
-            "infl",
-            "inflection",
-            "initialism",
-            "int",
-            "interfix",
-            "interj",
-            "interjection",
-            "jyut",
-            "latin",
-            "letter",
-            "locative",
-            "lujvo",
-            "monthbox",
-            "mutverb",
-            "name",
-            "nisba",
-            "nom",
-            "noun",
-            "noun form",
-            "noun-form",
-            "noun plural",
-            "noun-plural",
-            "nounprefix",
-            "num",
-            "number",
-            "numeral",
-            "ord",
-            "ordinal",
-            "par",
-            "part",
-            "part form",
-            "part-form",
-            "participle",
-            "particle",
-            "past",
-            "past neg",
-            "past-neg",
-            "past participle",
-            "past-participle",
-            "perfect participle",
-            "perfect-participle",
-            "personal pronoun",
-            "personal-pronoun",
-            "pref",
-            "prefix",
-            "phrase",
-            "pinyin",
-            "plural noun",
-            "plural-noun",
-            "pos",
-            "poss-noun",
-            "post",
-            "postp",
-            "postposition",
-            "PP",
-            "pp",
-            "ppron",
-            "pred",
-            "predicative",
-            "prep",
-            "prep phrase",
-            "prep-phrase",
-            "preposition",
-            "present participle",
-            "present-participle",
-            "pron",
-            "prondem",
-            "pronindef",
-            "pronoun",
-            "prop",
-            "proper noun",
-            "proper-noun",
-            "proper noun form",
-            "proper-noun form",
-            "proper noun-form",
-            "proper-noun-form",
-            "prov",
-            "proverb",
-            "prpn",
-            "prpr",
-            "punctuation mark",
-            "punctuation-mark",
-            "regnoun",
-            "rel",
-            "rom",
-            "romanji",
-            "root",
-            "sign",
-            "suff",
-            "suffix",
-            "syllable",
-            "symbol",
-            "verb",
-            "verb form",
-            "verb-form",
-            "verbal noun",
-            "verbal-noun",
-            "verbnec",
-            "vform",
-        ]
-    )
-    + r")(-|/|\+|$)"
+# Splits text into runs of newlines and the text between them, with an empty
+# string at either end if the text starts or ends with a newline.  "\n\n*"
+# instead of "\n+" lets the regex engine search for the first newline fast.
+NEWLINE_SPLIT_RE = re.compile(r"(\n\n*)")
+
+# Head templates: a few special template names, and names of the form
+# "<lang code>-<part of speech>" optionally followed by "-", "/" or "+".
+# Looked up with sets instead of a regex with thousands of alternatives.
+HEAD_TAG_SPECIAL_NAMES = frozenset(
+    [
+        "head",
+        "Han char",
+        "arabic-noun",
+        "arabic-noun-form",
+        "hangul-symbol",
+        "syllable-hangul",
+    ]
+)
+HEAD_TAG_LANG_CODES = frozenset(
+    ["latin", *(lang_code for lang_code, *_ in get_all_names("en"))]
+)
+HEAD_TAG_LANG_CODE_MAX_LEN = max(map(len, HEAD_TAG_LANG_CODES))
+HEAD_TAG_POS_SUFFIXES = frozenset(
+    [
+        "abbr",
+        "adj",
+        "adjective",
+        "adjective form",
+        "adjective-form",
+        "adv",
+        "adverb",
+        "affix",
+        "animal command",
+        "art",
+        "article",
+        "aux",
+        "bound pronoun",
+        "bound-pronoun",
+        "Buyla",
+        "card num",
+        "card-num",
+        "cardinal",
+        "chunom",
+        "classifier",
+        "clitic",
+        "cls",
+        "cmene",
+        "cmavo",
+        "colloq-verb",
+        "colverbform",
+        "combining form",
+        "combining-form",
+        "comparative",
+        "con",
+        "concord",
+        "conj",
+        "conjunction",
+        "conjug",
+        "cont",
+        "contr",
+        "converb",
+        "daybox",
+        "decl",
+        "decl noun",
+        "def",
+        "dem",
+        "det",
+        "determ",
+        "Deva",
+        "ending",
+        "entry",
+        "form",
+        "fuhivla",
+        "gerund",
+        "gismu",
+        "hanja",
+        "hantu",
+        "hanzi",
+        "head",
+        "ideophone",
+        "idiom",
+        "inf",
+        "indef",
+        "infixed pronoun",
+        "infixed-pronoun",
+        "infl",
+        "inflection",
+        "initialism",
+        "int",
+        "interfix",
+        "interj",
+        "interjection",
+        "jyut",
+        "latin",
+        "letter",
+        "locative",
+        "lujvo",
+        "monthbox",
+        "mutverb",
+        "name",
+        "nisba",
+        "nom",
+        "noun",
+        "noun form",
+        "noun-form",
+        "noun plural",
+        "noun-plural",
+        "nounprefix",
+        "num",
+        "number",
+        "numeral",
+        "ord",
+        "ordinal",
+        "par",
+        "part",
+        "part form",
+        "part-form",
+        "participle",
+        "particle",
+        "past",
+        "past neg",
+        "past-neg",
+        "past participle",
+        "past-participle",
+        "perfect participle",
+        "perfect-participle",
+        "personal pronoun",
+        "personal-pronoun",
+        "pref",
+        "prefix",
+        "phrase",
+        "pinyin",
+        "plural noun",
+        "plural-noun",
+        "pos",
+        "poss-noun",
+        "post",
+        "postp",
+        "postposition",
+        "PP",
+        "pp",
+        "ppron",
+        "pred",
+        "predicative",
+        "prep",
+        "prep phrase",
+        "prep-phrase",
+        "preposition",
+        "present participle",
+        "present-participle",
+        "pron",
+        "prondem",
+        "pronindef",
+        "pronoun",
+        "prop",
+        "proper noun",
+        "proper-noun",
+        "proper noun form",
+        "proper-noun form",
+        "proper noun-form",
+        "proper-noun-form",
+        "prov",
+        "proverb",
+        "prpn",
+        "prpr",
+        "punctuation mark",
+        "punctuation-mark",
+        "regnoun",
+        "rel",
+        "rom",
+        "romanji",
+        "root",
+        "sign",
+        "suff",
+        "suffix",
+        "syllable",
+        "symbol",
+        "verb",
+        "verb form",
+        "verb-form",
+        "verbal noun",
+        "verbal-noun",
+        "verbnec",
+        "vform",
+    ]
 )
 
-FLOATING_TABLE_TEMPLATES: set[str] = {
-    # az-suffix-form creates a style=floatright div that is otherwise
-    # deleted; if it is not pre-expanded, we can intercept the template
-    # so we add this set into do_not_pre_expand, and intercept the
-    # templates in parse_part_of_speech
-    "az-suffix-forms",
-    "az-inf-p",
-    "kk-suffix-forms",
-    "ky-suffix-forms",
-    "tr-inf-p",
-    "tr-suffix-forms",
-    "tt-suffix-forms",
-    "uz-suffix-forms",
-}
+
+def is_head_template(name: str) -> bool:
+    """Returns True if `name` is the name of a head template."""
+    if name in HEAD_TAG_SPECIAL_NAMES:
+        return True
+    # Language codes and part-of-speech suffixes can both contain "-", so
+    # try every "-" that could end a language code as the separator.
+    i = name.find("-", 0, HEAD_TAG_LANG_CODE_MAX_LEN + 1)
+    while i != -1:
+        if name[:i] in HEAD_TAG_LANG_CODES:
+            pos = name[i + 1 :]
+            if pos in HEAD_TAG_POS_SUFFIXES or (
+                pos.endswith(("-", "/", "+"))
+                and pos[:-1] in HEAD_TAG_POS_SUFFIXES
+            ):
+                return True
+        i = name.find("-", i + 1, HEAD_TAG_LANG_CODE_MAX_LEN + 1)
+    return False
+
+
+FLOATING_TABLE_TEMPLATES: frozenset[str] = frozenset(
+    {
+        # az-suffix-form creates a style=floatright div that is otherwise
+        # deleted; if it is not pre-expanded, we can intercept the template
+        # so we add this set into do_not_pre_expand, and intercept the
+        # templates in parse_part_of_speech
+        "az-suffix-forms",
+        "az-inf-p",
+        "kk-suffix-forms",
+        "ky-suffix-forms",
+        "tr-inf-p",
+        "tr-suffix-forms",
+        "tt-suffix-forms",
+        "uz-suffix-forms",
+    }
+)
 # These two should contain template names that should always be
 # pre-expanded when *first* processing the tree, or not pre-expanded
 # so that the template are left in place with their identifying
@@ -337,121 +371,124 @@ linkage_inverses: dict[str, str] = {
 
 # Templates that are used to form panels on pages and that
 # should be ignored in various positions
-PANEL_TEMPLATES: set[str] = {
-    "Character info",
-    "CJKV",
-    "French personal pronouns",
-    "French possessive adjectives",
-    "French possessive pronouns",
-    "Han etym",
-    "Japanese demonstratives",
-    "Latn-script",
-    "LDL",
-    "MW1913Abbr",
-    "Number-encoding",
-    "Nuttall",
-    "Spanish possessive adjectives",
-    "Spanish possessive pronouns",
-    "USRegionDisputed",
-    "Webster 1913",
-    "ase-rfr",
-    "attention",
-    "attn",
-    "beer",
-    "broken ref",
-    "ca-compass",
-    "character info",
-    "character info/var",
-    "checksense",
-    "compass-fi",
-    "copyvio suspected",
-    "delete",
-    "dial syn",  # Currently ignore these, but could be useful in Chinese/Korean
-    "etystub",
-    "examples",
-    "hu-corr",
-    "hu-suff-pron",
-    "interwiktionary",
-    "ja-kanjitab",
-    "ko-hanja-search",
-    "look",
-    "maintenance box",
-    "maintenance line",
-    "mediagenic terms",
-    "merge",
-    "missing template",
-    "morse links",
-    "move",
-    "multiple images",
-    "no inline",
-    "picdic",
-    "picdicimg",
-    "picdiclabel",
-    "polyominoes",
-    "predidential nomics",
-    "punctuation",  # This actually gets pre-expanded
-    "reconstructed",
-    "request box",
-    "rf-sound example",
-    "rfaccents",
-    "rfap",
-    "rfaspect",
-    "rfc",
-    "rfc-auto",
-    "rfc-header",
-    "rfc-level",
-    "rfc-pron-n",
-    "rfc-sense",
-    "rfclarify",
-    "rfd",
-    "rfd-redundant",
-    "rfd-sense",
-    "rfdate",
-    "rfdatek",
-    "rfdef",
-    "rfe",
-    "rfe/dowork",
-    "rfex",
-    "rfexp",
-    "rfform",
-    "rfgender",
-    "rfi",
-    "rfinfl",
-    "rfm",
-    "rfm-sense",
-    "rfp",
-    "rfp-old",
-    "rfquote",
-    "rfquote-sense",
-    "rfquotek",
-    "rfref",
-    "rfscript",
-    "rft2",
-    "rftaxon",
-    "rftone",
-    "rftranslit",
-    "rfv",
-    "rfv-etym",
-    "rfv-pron",
-    "rfv-quote",
-    "rfv-sense",
-    "selfref",
-    "split",
-    "stroke order",  # XXX consider capturing this?
-    "stub entry",
-    "t-needed",
-    "tbot entry",
-    "tea room",
-    "tea room sense",
-    # "ttbc", - XXX needed in at least on/Preposition/Translation page
-    "unblock",
-    "unsupportedpage",
-    "video frames",
-    "was wotd",
-    "wrongtitle",
-    "zh-forms",
-    "zh-hanzi-box",
-}
+PANEL_TEMPLATES: frozenset[str] = frozenset(
+    {
+        "Character info",
+        "CJKV",
+        "French personal pronouns",
+        "French possessive adjectives",
+        "French possessive pronouns",
+        "Han etym",
+        "Japanese demonstratives",
+        "Latn-script",
+        "LDL",
+        "MW1913Abbr",
+        "Number-encoding",
+        "Nuttall",
+        "Spanish possessive adjectives",
+        "Spanish possessive pronouns",
+        "USRegionDisputed",
+        "Webster 1913",
+        "ase-rfr",
+        "attention",
+        "attn",
+        "beer",
+        "broken ref",
+        "ca-compass",
+        "character info",
+        "character info/var",
+        "checksense",
+        "compass-fi",
+        "copyvio suspected",
+        "delete",
+        # Currently ignore these, but could be useful in Chinese/Korean
+        "dial syn",
+        "etystub",
+        "examples",
+        "hu-corr",
+        "hu-suff-pron",
+        "interwiktionary",
+        "ja-kanjitab",
+        "ko-hanja-search",
+        "look",
+        "maintenance box",
+        "maintenance line",
+        "mediagenic terms",
+        "merge",
+        "missing template",
+        "morse links",
+        "move",
+        "multiple images",
+        "no inline",
+        "picdic",
+        "picdicimg",
+        "picdiclabel",
+        "polyominoes",
+        "predidential nomics",
+        "punctuation",  # This actually gets pre-expanded
+        "reconstructed",
+        "request box",
+        "rf-sound example",
+        "rfaccents",
+        "rfap",
+        "rfaspect",
+        "rfc",
+        "rfc-auto",
+        "rfc-header",
+        "rfc-level",
+        "rfc-pron-n",
+        "rfc-sense",
+        "rfclarify",
+        "rfd",
+        "rfd-redundant",
+        "rfd-sense",
+        "rfdate",
+        "rfdatek",
+        "rfdef",
+        "rfe",
+        "rfe/dowork",
+        "rfex",
+        "rfexp",
+        "rfform",
+        "rfgender",
+        "rfi",
+        "rfinfl",
+        "rfm",
+        "rfm-sense",
+        "rfp",
+        "rfp-old",
+        "rfquote",
+        "rfquote-sense",
+        "rfquotek",
+        "rfref",
+        "rfscript",
+        "rft2",
+        "rftaxon",
+        "rftone",
+        "rftranslit",
+        "rfv",
+        "rfv-etym",
+        "rfv-pron",
+        "rfv-quote",
+        "rfv-sense",
+        "selfref",
+        "split",
+        "stroke order",  # XXX consider capturing this?
+        "stub entry",
+        "t-needed",
+        "tbot entry",
+        "tea room",
+        "tea room sense",
+        # "ttbc", - XXX needed in at least on/Preposition/Translation page
+        "unblock",
+        "unsupportedpage",
+        "video frames",
+        "was wotd",
+        "wrongtitle",
+        "zh-forms",
+        "zh-hanzi-box",
+    }
+)
 
 # lookup table for the tags of Chinese dialectal synonyms
 zh_tag_lookup: dict[str, list[str]] = {
@@ -461,34 +498,34 @@ zh_tag_lookup: dict[str, list[str]] = {
     "now usually derogatory or offensive": ["offensive", "derogatory"],
     "lofty": [],
 }
+# Turns parenthesized qualifiers in Chinese dialectal synonym tags into
+# comma-separated ones
+zh_tag_paren_table = str.maketrans({"(": ",", ")": ""})
 
 # Template name prefixes used for language-specific panel templates (i.e.,
 # templates that create side boxes or notice boxes or that should generally
 # be ignored).
-PANEL_PREFIXES: set[str] = {
-    "list:compass points/",
-    "list:Gregorian calendar months/",
-    "RQ:",
-}
+PANEL_PREFIXES: frozenset[str] = frozenset(
+    {
+        "list:compass points/",
+        "list:Gregorian calendar months/",
+        "RQ:",
+    }
+)
 
 # Templates used for wikipedia links.
-wikipedia_templates: set[str] = {
-    "wikipedia",
-    "slim-wikipedia",
-    "w",
-    "W",
-    "swp",
-    "wiki",
-    "Wikipedia",
-    "wtorw",
-}
-for x in PANEL_PREFIXES & wikipedia_templates:
-    print(
-        "WARNING: {!r} in both panel_templates and wikipedia_templates".format(
-            x
-        )
-    )
-
+wikipedia_templates: frozenset[str] = frozenset(
+    {
+        "wikipedia",
+        "slim-wikipedia",
+        "w",
+        "W",
+        "swp",
+        "wiki",
+        "Wikipedia",
+        "wtorw",
+    }
+)
 # Mapping from a template name (without language prefix) for the main word
 # (e.g., fi-noun, fi-adj, en-verb) to permitted parts-of-speech in which
 # it could validly occur.  This is used as just a sanity check to give
@@ -526,15 +563,6 @@ template_allowed_pos_map: dict[str, list[str]] = {
     "misspelling": ["noun", "adj", "verb", "adv"],
     "part-form": ["verb"],
 }
-for k, v in template_allowed_pos_map.items():
-    for x in v:
-        if x not in PARTS_OF_SPEECH:
-            print(
-                "BAD PART OF SPEECH {!r} IN template_allowed_pos_map: {}={}"
-                "".format(x, k, v)
-            )
-            assert False
-
 
 # Templates ignored during etymology extraction, i.e., these will not be listed
 # in the extracted etymology templates.
@@ -583,102 +611,163 @@ ignored_etymology_templates: list[str] = [
     "ll",
     "l-self",
 ]
-# Regexp for matching ignored etymology template names.  This adds certain
-# prefixes to the names listed above.
-ignored_etymology_templates_re = re.compile(
-    r"^((cite-|R:|RQ:).*|"
-    + r"|".join(re.escape(x) for x in ignored_etymology_templates)
-    + r")$"
-)
+IGNORED_ETYMOLOGY_TEMPLATES = frozenset(ignored_etymology_templates)
+# Templates starting with these prefixes are ignored as well
+IGNORED_ETYMOLOGY_TEMPLATE_PREFIXES = ("cite-", "R:", "RQ:")
+
+
+def is_ignored_etymology_template(name: str) -> bool:
+    """Returns True if the template should be ignored in etymologies: it is
+    listed above or starts with one of the ignored prefixes."""
+    return name in IGNORED_ETYMOLOGY_TEMPLATES or name.startswith(
+        IGNORED_ETYMOLOGY_TEMPLATE_PREFIXES
+    )
+
 
-# Regexp for matching ignored descendants template names. Right now we just
-# copy the ignored etymology templates
-ignored_descendants_templates_re = ignored_etymology_templates_re
+# Ignored descendants templates. Right now we just copy the ignored
+# etymology templates
+is_ignored_descendants_template = is_ignored_etymology_template
 
 # Set of template names that are used to define usage examples.  If the usage
 # example contains one of these templates, then it its type is set to
 # "example"
-usex_templates: set[str] = {
-    "afex",
-    "affixusex",
-    "co",  # {{collocation}} acts like a example template, specifically for
-    # pairs of combinations of words that are more common than you'd
-    # except would be randomly; hlavní#Czech
-    "coi",
-    "collocation",
-    "el-example",
-    "el-x",
-    "example",
-    "examples",
-    "he-usex",
-    "he-x",
-    "hi-usex",
-    "hi-x",
-    "ja-usex-inline",
-    "ja-usex",
-    "ja-x",
-    "jbo-example",
-    "jbo-x",
-    "km-usex",
-    "km-x",
-    "ko-usex",
-    "ko-x",
-    "lo-usex",
-    "lo-x",
-    "ne-x",
-    "ne-usex",
-    "prefixusex",
-    "ryu-usex",
-    "ryu-x",
-    "shn-usex",
-    "shn-x",
-    "suffixusex",
-    "th-usex",
-    "th-x",
-    "ur-usex",
-    "ur-x",
-    "usex",
-    "usex-suffix",
-    "ux",
-    "uxi",
-}
+usex_templates: frozenset[str] = frozenset(
+    {
+        "afex",
+        "affixusex",
+        "co",  # {{collocation}} acts like a example template, specifically for
+        # pairs of combinations of words that are more common than you'd
+        # except would be randomly; hlavní#Czech
+        "coi",
+        "collocation",
+        "el-example",
+        "el-x",
+        "example",
+        "examples",
+        "he-usex",
+        "he-x",
+        "hi-usex",
+        "hi-x",
+        "ja-usex-inline",
+        "ja-usex",
+        "ja-x",
+        "jbo-example",
+        "jbo-x",
+        "km-usex",
+        "km-x",
+        "ko-usex",
+        "ko-x",
+        "lo-usex",
+        "lo-x",
+        "ne-x",
+        "ne-usex",
+        "prefixusex",
+        "ryu-usex",
+        "ryu-x",
+        "shn-usex",
+        "shn-x",
+        "suffixusex",
+        "th-usex",
+        "th-x",
+        "ur-usex",
+        "ur-x",
+        "usex",
+        "usex-suffix",
+        "ux",
+        "uxi",
+    }
+)
 
-stop_head_at_these_templates: set[str] = {
-    "category",
-    "cat",
-    "topics",
-    "catlangname",
-    "c",
-    "C",
-    "top",
-    "cln",
-}
+# Usage example templates that are not expanded into glosses
+gloss_example_templates: frozenset[str] = frozenset(
+    {
+        "ux",
+        "uxi",
+        "usex",
+        "afex",
+        "prefixusex",
+        "ko-usex",
+        "ko-x",
+        "hi-x",
+        "ja-usex-inline",
+        "ja-x",
+        "quotei",
+        "he-x",
+        "km-x",
+        "ne-x",
+        "shn-x",
+        "th-x",
+        "ur-x",
+    }
+)
+
+# Templates in translation items whose contents are ignored
+translation_ignored_templates: frozenset[str] = frozenset(
+    {"t+check", "t-check", "t-needed"}
+)
+# Templates in translation items that give the translation and language code
+translation_templates: frozenset[str] = frozenset(
+    {"t", "t+", "t-simple", "tt", "tt+"}
+)
+# Templates around translation tables that are expanded in the default way
+translation_expanded_templates: frozenset[str] = frozenset(
+    {
+        "c",
+        "C",
+        "categorize",
+        "cat",
+        "catlangname",
+        "topics",
+        "top",
+        "qualifier",
+        "cln",
+        "trans-bottom",
+        "trans-mid",
+        "checktrans-mid",
+        "checktrans-bottom",
+    }
+)
+
+stop_head_at_these_templates: frozenset[str] = frozenset(
+    {
+        "category",
+        "cat",
+        "topics",
+        "catlangname",
+        "c",
+        "C",
+        "top",
+        "cln",
+    }
+)
 
 # Set of template names that are used to define quotation examples.  If the
 # usage example contains one of these templates, then its type is set to
 # "quotation".
-quotation_templates: set[str] = {
-    "collapse-quote",
-    "quote-av",
-    "quote-book",
-    "quote-GYLD",
-    "quote-hansard",
-    "quotei",
-    "quote-journal",
-    "quotelite",
-    "quote-mailing list",
-    "quote-meta",
-    "quote-newsgroup",
-    "quote-song",
-    "quote-text",
-    "quote",
-    "quote-us-patent",
-    "quote-video game",
-    "quote-web",
-    "quote-wikipedia",
-    "wikiquote",
-    "Wikiquote",
-}
+quotation_templates: frozenset[str] = frozenset(
+    {
+        "collapse-quote",
+        "quote-av",
+        "quote-book",
+        "quote-GYLD",
+        "quote-hansard",
+        "quotei",
+        "quote-journal",
+        "quotelite",
+        "quote-mailing list",
+        "quote-meta",
+        "quote-newsgroup",
+        "quote-song",
+        "quote-text",
+        "quote",
+        "quote-us-patent",
+        "quote-video game",
+        "quote-web",
+        "quote-wikipedia",
+        "wikiquote",
+        "Wikiquote",
+    }
+)
 
 taxonomy_templates = {
     # argument 1 should be the taxonomic name, frex. "Lupus lupus"
@@ -747,6 +836,12 @@ def decode_html_entities(v: Union[str, int]) -> str:
     return html.unescape(v)
 
 
+# Names of the qualifier and English translation arguments for the n-th word
+# of a sense linkage template (q1, t1, ...), indexed by n
+LINKAGE_QUALIFIER_KEYS = tuple(f"q{i}" for i in range(20))
+LINKAGE_TRANSLATION_KEYS = tuple(f"t{i}" for i in range(20))
+
+
 def parse_sense_linkage(
     wxr: WiktextractContext,
     data: SenseData,
@@ -759,10 +854,14 @@ def parse_sense_linkage(
     assert isinstance(name, str)
     assert isinstance(ht, dict)
     field = sense_linkage_templates[name]
+    thesaurus_prefixes = ns_title_prefix_tuple(wxr, "Thesaurus")
     for i in range(2, 20):
-        w = ht.get(i) or ""
+        w = ht.get(i)
+        if not w:
+            # Words are in consecutive positional arguments
+            break
         w = clean_node(wxr, data, w)
-        for alias in ns_title_prefix_tuple(wxr, "Thesaurus"):
+        for alias in thesaurus_prefixes:
             if w.startswith(alias):
                 w = w[len(alias) :]
                 break
@@ -772,7 +871,7 @@ def parse_sense_linkage(
         topics: list[str] = []
         english: Optional[str] = None
         # Try to find qualifiers for this synonym
-        q = ht.get("q{}".format(i - 1))
+        q = ht.get(LINKAGE_QUALIFIER_KEYS[i - 1])
         if q:
             cls = classify_desc(q)
             if cls == "tags":
@@ -786,7 +885,7 @@ def parse_sense_linkage(
                 else:
                     english = q
         # Try to find English translation for this synonym
-        t = ht.get("t{}".format(i - 1))
+        t = ht.get(LINKAGE_TRANSLATION_KEYS[i - 1])
         if t:
             if english:
                 english += "; " + t
@@ -795,16 +894,21 @@ def parse_sense_linkage(
 
         # See if the linkage contains a parenthesized alt
         alt = None
-        m = re.search(r"\(([^)]+)\)$", w)
-        if m:
-            w = w[: m.start()].strip()
-            alt = m.group(1)
-
-        dt = {"word": w}
+        if w.endswith(")"):
+            # Find the first "(" after any earlier ")", as the regexp
+            # r"\(([^)]+)\)$" would
+            paren = w.find("(", w.rfind(")", 0, -1) + 1, -2)
+            if paren >= 0:
+                alt = w[paren + 1 : -1]
+                w = w[:paren].strip()
+
+        # tags and topics are fresh lists for each word, so they can be
+        # stored without copying
+        dt: LinkageData = {"word": w}
         if tags:
-            data_extend(dt, "tags", tags)
+            dt["tags"] = tags
         if topics:
-            data_extend(dt, "topics", topics)
+            dt["topics"] = topics
         if english:
             dt["english"] = english
         if alt:
@@ -850,6 +954,33 @@ QUALIFIERS = r"^\((([^()]|\([^()]*\))*)\):?\s*"
 QUALIFIERS_RE = re.compile(QUALIFIERS)
 # (...): ... or (...(...)...): ...
 
+# Regexps used for every header and gloss in parse_language()
+WHITESPACE_RE = re.compile(r"\s+")
+WIKIDATA_ID_RE = re.compile(r"Q\d+$")
+LINK_TEXT_RE = re.compile(r"\[\[([^]]*)\]\]")
+# Manually typed ordered list numbers at the start of a gloss ("1. ")
+GLOSS_NUMBER_RE = re.compile(r"^\d+\.\s+")
+# "[from 14th c.]" and similar at the end of a gloss
+GLOSS_BRACKETED_END_RE = re.compile(r"\s\[[^]]*\]\s*$")
+# Sentences in quotes after the gloss, e.g. in "iacebam"
+QUOTED_SUBGLOSS_RE = re.compile(r'\s*(\([^)]*\)\s*)?"[^"]*"\s*$')
+
+# Names of inflection table templates, e.g. {{fi-decl-valo}}
+INFLECTION_TEMPLATE_RE = re.compile(
+    r"-(conj|decl|ndecl|adecl|infl|conjugation|"
+    r"declension|inflection|mut|mutation)($|-)"
+)
+# Template delimiters in an inflection section
+TEMPLATE_BRACES_RE = re.compile(r"{{+|}}+")
+FIRST_TEMPLATE_NAME_RE = re.compile(r"{{([^}{|]+)\|?")
+
+# Links to the translations subpage, e.g. [[word/translations]]
+TRANSLATIONS_SUBPAGE_SUFFIX = "/" + TRANSLATIONS_TITLE
+# The "Etymology 2: Noun" style argument of {{see translation subpage}}
+TRANSLATION_SUBPAGE_ARG_RE = re.compile(
+    r"\s*(([^:\d]*)\s*\d*)\s*:\s*([^:]*)\s*"
+)
+
 
 def parse_language(
     wxr: WiktextractContext, langnode: WikiNode, language: str, lang_code: str
@@ -890,6 +1021,8 @@ def parse_language(
     }
     if is_reconstruction:
         data_append(base_data, "tags", "reconstruction")
+    # Language-specific head templates, e.g. {{en-noun}}
+    head_template_prefix = f"{lang_code}-"
     sense_data: SenseData = {}
     pos_data: WordData = {}  # For a current part-of-speech
     level_four_data: WordData = {}  # Chinese Pronunciation-sections in-between
@@ -913,7 +1046,7 @@ def parse_language(
         for k, v in base.items():
             # Copy the value to ensure that we don't share lists or
             # dicts between structures (even nested ones).
-            v = copy.deepcopy(v)
+            v = copy_data(v)
             if k not in data:
                 # The list was copied above, so this will not create shared ref
                 data[k] = v  # type: ignore[literal-required]
@@ -935,33 +1068,29 @@ def parse_language(
                     sortid="page/904",
                 )
 
-        def complementary_pop(pron: SoundData, key: str) -> SoundData:
-            """Remove unnecessary keys from dict values
-            in a list comprehension..."""
-            if key in pron:
-                pron.pop(key)  # type: ignore
-            return pron
-
         # If the result has sounds, eliminate sounds that have a prefix that
         # does not match "word" or one of "forms"
         if "sounds" in data and "word" in data:
-            accepted = [data["word"]]
-            accepted.extend(f["form"] for f in data.get("forms", dict()))
-            data["sounds"] = list(
+            accepted = {data["word"]}
+            accepted.update(f["form"] for f in data.get("forms", ()))
+            data["sounds"] = [
                 s
                 for s in data["sounds"]
                 if "form" not in s or s["form"] in accepted
-            )
+            ]
         # If the result has sounds, eliminate sounds that have a pos that
         # does not match "pos"
         if "sounds" in data and "pos" in data:
-            data["sounds"] = list(
-                complementary_pop(s, "pos")
-                for s in data["sounds"]
+            sounds = []
+            for s in data["sounds"]:
                 # "pos" is not a field of SoundData, correctly, so we're
                 # removing it here. It's a kludge on a kludge on a kludge.
-                if "pos" not in s or s["pos"] == data["pos"]  # type: ignore[typeddict-item]
-            )
+                if "pos" in s:
+                    if s["pos"] != data["pos"]:  # type: ignore[typeddict-item]
+                        continue
+                    del s["pos"]  # type: ignore[typeddict-item]
+                sounds.append(s)
+            data["sounds"] = sounds
 
     def push_sense() -> bool:
         """Starts collecting data for a new word sense.  This returns True
@@ -975,29 +1104,26 @@ def parse_language(
         ):
             return False
 
+        etym = etym_data.get("etymology_text")
         if (
-            (
-                "participle" in sense_data.get("tags", ())
-                or "infinitive" in sense_data.get("tags", ())
-            )
+            ("participle" in tags or "infinitive" in tags)
             and "alt_of" not in sense_data
             and "form_of" not in sense_data
-            and "etymology_text" in etym_data
-            and etym_data["etymology_text"] != ""
+            and etym
         ):
-            etym = etym_data["etymology_text"]
             etym = etym.split(". ")[0]
             ret = parse_alt_or_inflection_of(wxr, etym, set())
             if ret is not None:
-                tags, lst = ret
+                form_tags, lst = ret
                 assert isinstance(lst, (list, tuple))
-                if "form-of" in tags:
+                if "form-of" in form_tags:
                     data_extend(sense_data, "form_of", lst)
-                    data_extend(sense_data, "tags", tags)
-                elif "alt-of" in tags:
+                    data_extend(sense_data, "tags", form_tags)
+                elif "alt-of" in form_tags:
                     data_extend(sense_data, "alt_of", lst)
-                    data_extend(sense_data, "tags", tags)
+                    data_extend(sense_data, "tags", form_tags)
 
+        # The tags may have been extended above
         if not sense_data.get("glosses") and "no-gloss" not in sense_data.get(
             "tags", ()
         ):
@@ -1090,7 +1216,7 @@ def parse_language(
                 data_append(pos_data, "tags", "Pinyin")
             elif t == "romanization":
                 data_append(pos_data, "tags", "romanization")
-        if HEAD_TAG_RE.fullmatch(name) is not None:
+        if is_head_template(name):
             args_ht = clean_template_args(wxr, ht)
             cleaned_expansion = clean_node(wxr, None, expansion)
             dt = {"name": name, "args": args_ht, "expansion": cleaned_expansion}
@@ -1164,15 +1290,15 @@ def parse_language(
         floaters, poschildren = recursively_extract(
             posnode.children,
             lambda x: (
-                isinstance(x, WikiNode)
-                and x.kind == NodeKind.TEMPLATE
+                isinstance(x, TemplateNode)
                 and x.largs[0][0] in FLOATING_TABLE_TEMPLATES
             ),
         )
-        tempnode = WikiNode(NodeKind.LEVEL6, 0)
-        tempnode.largs = [["Inflection"]]
-        tempnode.children = floaters
-        parse_inflection(tempnode, "Floating Div", pos)
+        if floaters:
+            tempnode = WikiNode(NodeKind.LEVEL6, 0)
+            tempnode.largs = [["Inflection"]]
+            tempnode.children = floaters
+            parse_inflection(tempnode, "Floating Div", pos)
         # print(poschildren)
         # XXX new above
 
@@ -1189,10 +1315,11 @@ def parse_language(
                 )
             return
 
+        category_prefixes = ns_title_prefix_tuple(wxr, "Category")
+        file_prefixes = ns_title_prefix_tuple(wxr, "File")
         for node in poschildren:
             if isinstance(node, str):
-                for m in re.finditer(r"\n+|[^\n]+", node):
-                    p = m.group(0)
+                for p in NEWLINE_SPLIT_RE.split(node):
                     if p.startswith("\n\n") and pre:
                         first_para = False
                         start_of_paragraph = True
@@ -1221,16 +1348,12 @@ def parse_language(
                 if len(node.largs[0]) >= 1 and isinstance(
                     node.largs[0][0], str
                 ):
-                    if node.largs[0][0].startswith(
-                        ns_title_prefix_tuple(wxr, "Category")
-                    ):
+                    if node.largs[0][0].startswith(category_prefixes):
                         # [[Category:...]]
                         # We're at the end of the file, probably, so stop
                         # here. Otherwise the head will get garbage.
                         break
-                    if node.largs[0][0].startswith(
-                        ns_title_prefix_tuple(wxr, "File")
-                    ):
+                    if node.largs[0][0].startswith(file_prefixes):
                         # Skips file links
                         continue
                 start_of_paragraph = False
@@ -1259,8 +1382,9 @@ def parse_language(
                 # There's head_tag_re that seems like a regex meant
                 # to identify head templates. Too bad it's None.
 
+                template_name = node.template_name
                 # ignore {{category}}, {{cat}}... etc.
-                if node.template_name in stop_head_at_these_templates:
+                if template_name in stop_head_at_these_templates:
                     # we've reached a template that should be at the end,
                     continue
 
@@ -1269,7 +1393,7 @@ def parse_language(
                 # head parsing quite well.
                 # node.largs[0][0] should always be str, but can't type-check
                 # that.
-                if is_panel_template(wxr, node.template_name):
+                if is_panel_template(wxr, template_name):
                     continue
                 # skip these templates
                 # if node.largs[0][0] in skip_these_templates_in_head:
@@ -1332,6 +1456,8 @@ def parse_language(
         if not any(g for g in lists):
             process_gloss_without_list(poschildren, pos, pos_data, header_tags)
         else:
+            # Heads after this index have no list of senses
+            last_head_with_list = max(i for i, ls in enumerate(lists) if ls)
             for i, (pre1, ls) in enumerate(zip(pre, lists)):
                 # if len(ls) == 0:
                 #     # don't have gloss list
@@ -1339,7 +1465,7 @@ def parse_language(
                 #     # that isn't a head template or head.
                 # continue
 
-                if all(not sl for sl in lists[i:]):
+                if i > last_head_with_list:
                     if i == 0:
                         if isinstance(node, str):
                             wxr.wtp.debug(
@@ -1500,7 +1626,7 @@ def parse_language(
         header_text = clean_node(
             wxr, pos_data, header_nodes, post_template_fn=head_post_template_fn
         )
-        header_text = re.sub(r"\s+", " ", header_text)
+        header_text = WHITESPACE_RE.sub(" ", header_text)
         # print(f"{header_text=}")
         parse_word_head(
             wxr,
@@ -1532,15 +1658,15 @@ def parse_language(
         for node in strip_nodes(nodes):
             if isinstance(node, WikiNode):
                 if isinstance(node, TemplateNode):
-                    if node.template_name in (
+                    template_name = node.template_name
+                    if template_name in (
                         "zh-see",
                         "ja-see",
                         "ja-see-kango",
                     ):
                         continue  # soft redirect
-                    elif (
-                        node.template_name == "head"
-                        or node.template_name.startswith(f"{lang_code}-")
+                    elif template_name == "head" or template_name.startswith(
+                        head_template_prefix
                     ):
                         header_nodes.append(node)
                         continue
@@ -1609,39 +1735,30 @@ def parse_language(
         current_depth = node.sarg
 
         children = node.children
+        subentry_sarg = current_depth + "#"
 
         # subentries, (presumably) a list
         # of subglosses below this. The list's
         # argument ends with #, and its depth should
         # be bigger than parent node.
-        subentries = [
-            x
-            for x in children
-            if isinstance(x, WikiNode)
-            and x.kind == NodeKind.LIST
-            and x.sarg == current_depth + "#"
-        ]
-
+        subentries: list[WikiNode] = []
         # sublists of examples and quotations. .sarg
         # does not end with "#".
-        others = [
-            x
-            for x in children
-            if isinstance(x, WikiNode)
-            and x.kind == NodeKind.LIST
-            and x.sarg != current_depth + "#"
-        ]
-
+        others: list[WikiNode] = []
         # the actual contents of this particular node.
         # can be a gloss (or a template that expands into
         # many glosses which we can't easily pre-expand)
         # or could be an "outer gloss" with more specific
         # subglosses, or could be a qualfier for the subglosses.
-        contents = [
-            x
-            for x in children
-            if not isinstance(x, WikiNode) or x.kind != NodeKind.LIST
-        ]
+        contents: list[Union[str, WikiNode]] = []
+        for x in children:
+            if isinstance(x, WikiNode) and x.kind == NodeKind.LIST:
+                if x.sarg == subentry_sarg:
+                    subentries.append(x)
+                else:
+                    others.append(x)
+            else:
+                contents.append(x)
         # If this entry has sublists of entries, we should combine
         # gloss information from both the "outer" and sublist content.
         # Sometimes the outer gloss
@@ -1664,13 +1781,7 @@ def parse_language(
                 # loop infinitely.
                 cropped_node = copy.copy(node)
                 cropped_node.children = [
-                    x
-                    for x in children
-                    if not (
-                        isinstance(x, WikiNode)
-                        and x.kind == NodeKind.LIST
-                        and x.sarg == current_depth + "#"
-                    )
+                    x for x in children if x is not subentries[0]
                 ]
                 added |= parse_sense_node(cropped_node, sense_base, pos)
                 nonlocal sense_data  # this kludge causes duplicated raw_
@@ -1731,7 +1842,7 @@ def parse_language(
             if name == "senseid":
                 langid = clean_node(wxr, None, ht.get(1, ()))
                 arg = clean_node(wxr, sense_base, ht.get(2, ()))
-                if re.match(r"Q\d+$", arg):
+                if WIKIDATA_ID_RE.match(arg):
                     data_append(sense_base, "wikidata", arg)
                 data_append(sense_base, "senseid", langid + ":" + arg)
             if name in sense_linkage_templates:
@@ -1741,26 +1852,7 @@ def parse_language(
             if name == "†" or name == "zh-obsolete":
                 data_append(sense_base, "tags", "obsolete")
                 return ""
-            if name in {
-                "ux",
-                "uxi",
-                "usex",
-                "afex",
-                "prefixusex",
-                "ko-usex",
-                "ko-x",
-                "hi-x",
-                "ja-usex-inline",
-                "ja-x",
-                "quotei",
-                "he-x",
-                "hi-x",
-                "km-x",
-                "ne-x",
-                "shn-x",
-                "th-x",
-                "ur-x",
-            }:
+            if name in gloss_example_templates:
                 # Usage examples are captured separately below.  We don't
                 # want to expand them into glosses even when unusual coding
                 # is used in the entry.
@@ -1794,8 +1886,7 @@ def parse_language(
             if isinstance(item, str):
                 # There seem to be HTML sections that may futher contain
                 # unparsed links.
-                for m in re.finditer(r"\[\[([^]]*)\]\]", item):
-                    print("ITER:", m.group(0))
+                for m in LINK_TEXT_RE.finditer(item):
                     v = m.group(1).split("|")[-1].strip()
                     if v:
                         gloss_template_args.add(v)
@@ -1834,7 +1925,7 @@ def parse_language(
             return False
 
         # remove manually typed ordered list text at the start("1. ")
-        rawgloss = re.sub(r"^\d+\.\s+", "", rawgloss).strip()
+        rawgloss = GLOSS_NUMBER_RE.sub("", rawgloss).strip()
 
         # get stuff like synonyms and categories from "others",
         # maybe examples and quotations
@@ -1889,11 +1980,8 @@ def parse_language(
             return push_sense()
 
         # Remove certain substrings specific to outer glosses
-        strip_ends = [", particularly:"]
-        for x in strip_ends:
-            if rawgloss.endswith(x):
-                rawgloss = rawgloss[: -len(x)].strip()
-                break
+        if rawgloss.endswith(", particularly:"):
+            rawgloss = rawgloss.removesuffix(", particularly:").strip()
 
         # A single gloss, or possibly an outer gloss.
         # Check if the possible outer gloss starts with
@@ -1934,7 +2022,7 @@ def parse_language(
                 supergloss = supergloss[2:].strip()
 
             # remove [14th century...] style brackets at the end
-            supergloss = re.sub(r"\s\[[^]]*\]\s*$", "", supergloss)
+            supergloss = GLOSS_BRACKETED_END_RE.sub("", supergloss)
 
             if supergloss.startswith((",", ":")):
                 supergloss = supergloss[1:]
@@ -1966,7 +2054,7 @@ def parse_language(
                     continue
                 # copy sense_base to prevent cross-contamination between
                 # subglosses and other subglosses and superglosses
-                sense_base2 = copy.deepcopy(sense_base)
+                sense_base2 = copy_data(sense_base)
                 if parse_sense_node(item, sense_base2, pos):
                     added = True
 
@@ -1996,7 +2084,7 @@ def parse_language(
         indexed_subglosses = list(
             (i, gl)
             for i, gl in enumerate(subglosses)
-            if gl.strip() and not re.match(r'\s*(\([^)]*\)\s*)?"[^"]*"\s*$', gl)
+            if gl.strip() and not QUOTED_SUBGLOSS_RE.match(gl)
         )
 
         if len(indexed_subglosses) > 1 and "form_of" not in sense_base:
@@ -2016,6 +2104,18 @@ def parse_language(
                     data_extend(sense_base, "tags", infl_tags)
                     indexed_subglosses = indexed_subglosses[1:]
 
+        # Data copied from sense_base to every sense below; sense_base is not
+        # modified in the loop, so its values are only classified once
+        base_items: list[tuple[str, Any, bool]] = []
+        for k, v in sense_base.items():
+            if isinstance(v, (list, tuple)):
+                if k != "tags":
+                    # Tags handled below (countable/uncountable special)
+                    base_items.append((k, v, True))
+            else:
+                assert k not in ("tags", "categories", "topics")
+                base_items.append((k, v, False))
+
         # Create senses for remaining subglosses
         for i, (gloss_i, gloss) in enumerate(indexed_subglosses):
             gloss = gloss.strip()
@@ -2042,13 +2142,10 @@ def parse_language(
                 data_extend(sense_data, "tags", ["obsolete", "historical"])
                 gloss = gloss[2:].strip()
             # Copy data for all senses to this sense
-            for k, v in sense_base.items():
-                if isinstance(v, (list, tuple)):
-                    if k != "tags":
-                        # Tags handled below (countable/uncountable special)
-                        data_extend(sense_data, k, v)
+            for k, v, is_list in base_items:
+                if is_list:
+                    data_extend(sense_data, k, v)
                 else:
-                    assert k not in ("tags", "categories", "topics")
                     sense_data[k] = v  # type:ignore[literal-required]
             # Parse the gloss for this particular sense
             m = QUALIFIERS_RE.match(gloss)
@@ -2058,10 +2155,14 @@ def parse_language(
                 gloss = gloss[m.end() :].strip()
 
             # Remove common suffix "[from 14th c.]" and similar
-            gloss = re.sub(r"\s\[[^]]*\]\s*$", "", gloss)
+            gloss = GLOSS_BRACKETED_END_RE.sub("", gloss)
 
             # Check to make sure we don't have unhandled list items in gloss
-            ofs = max(gloss.find("#"), gloss.find("* "))
+            # (a list marker past offset 10 needs a gloss of 12+ characters)
+            if len(gloss) > 11:
+                ofs = max(gloss.find("#"), gloss.find("* "))
+            else:
+                ofs = -1
             if ofs > 10 and "(#)" not in gloss:
                 wxr.wtp.debug(
                     "gloss may contain unhandled list items: {}".format(gloss),
@@ -2095,14 +2196,18 @@ def parse_language(
             # in individual senses.
             countability_tags = []
             base_tags = sense_base.get("tags", ())
-            sense_tags = sense_data.get("tags", ())
+            sense_tags = set(sense_data.get("tags", ()))
+            new_tags = []
             for tag in base_tags:
                 if tag in ("countable", "uncountable"):
                     if tag not in countability_tags:
                         countability_tags.append(tag)
                     continue
                 if tag not in sense_tags:
-                    data_append(sense_data, "tags", tag)
+                    new_tags.append(tag)
+                    sense_tags.add(tag)
+            if new_tags:
+                data_extend(sense_data, "tags", new_tags)
             if countability_tags:
                 if (
                     "countable" not in sense_tags
@@ -2142,18 +2247,22 @@ def parse_language(
             # Kludge: there are cases (e.g., etc./Swedish) where there are
             # two abbreviations in the same sense, both generated by the
             # {{abbreviation of|...}} template.  Handle these with some magic.
-            position = 0
-            split_glosses = []
-            for m in re.finditer(r"Abbreviation of ", gloss):
-                if m.start() != position:
-                    split_glosses.append(gloss[position : m.start()])
-                    position = m.start()
-            split_glosses.append(gloss[position:])
+            split_glosses = gloss.split("Abbreviation of ")
+            if len(split_glosses) > 1:
+                split_glosses[1:] = [
+                    "Abbreviation of " + x for x in split_glosses[1:]
+                ]
+                if not split_glosses[0]:
+                    del split_glosses[0]
             for gloss in split_glosses:
                 # Check if this gloss describes an alt-of or inflection-of
                 if (
                     lang_code != "en"
                     and " " not in gloss
+                    # The edit distance is at least the length difference,
+                    # so skip distw() when that alone reaches the limit
+                    and abs(len(word) - len(gloss)) * 10
+                    < 3 * max(len(word), len(gloss))
                     and distw([word], gloss) < 0.3
                 ):
                     # Don't try to parse gloss if it is one word
@@ -2228,12 +2337,7 @@ def parse_language(
                 # These are not to be captured as an exception to the
                 # generic code below
                 return None
-            m = re.search(
-                r"-(conj|decl|ndecl|adecl|infl|conjugation|"
-                r"declension|inflection|mut|mutation)($|-)",
-                name,
-            )
-            if m:
+            if INFLECTION_TEMPLATE_RE.search(name):
                 args_ht = clean_template_args(wxr, ht)
                 dt = {"name": name, "args": args_ht}
                 data_append(pos_data, "inflection_templates", dt)
@@ -2245,8 +2349,7 @@ def parse_language(
         text = wxr.wtp.node_to_wikitext(node.children)
 
         # Split text into separate sections for each to-level template
-        brace_matches = re.split("({{+|}}+)", text)  # ["{{", "template", "}}"]
-        template_sections = []
+        texts = []
         template_nesting = 0  # depth of SINGLE BRACES { { nesting } }
         # Because there is the possibility of triple curly braces
         # ("{{{", "}}}") in addition to normal ("{{ }}"), we do not
@@ -2257,53 +2360,37 @@ def parse_language(
         # about the outer-most delimiters (the highest level template)
         # we can just count the single braces when those single
         # braces are part of a group.
-
-        # print(text)
-        # print(repr(brace_matches))
-        if len(brace_matches) > 1:
-            tsection: list[str] = []
-            after_templates = False  # kludge to keep any text
-            # before first template
-            # with the first template;
-            # otherwise, text
-            # goes with preceding template
-            for m in brace_matches:
-                if m.startswith("{{"):
-                    if template_nesting == 0 and after_templates:
-                        template_sections.append(tsection)
-                        tsection = []
-                        # start new section
-                    after_templates = True
-                    template_nesting += len(m)
-                    tsection.append(m)
-                elif m.startswith("}}"):
-                    template_nesting -= len(m)
-                    if template_nesting < 0:
-                        wxr.wtp.error(
-                            "Negatively nested braces, "
-                            "couldn't split inflection templates, "
-                            "{}/{} section {}".format(word, language, section),
-                            sortid="page/1871",
-                        )
-                        template_sections = []  # use whole text
-                        break
-                    tsection.append(m)
-                else:
-                    tsection.append(m)
-            if tsection:  # dangling tsection
-                template_sections.append(tsection)
-                # Why do it this way around? The parser has a preference
-                # to associate bits outside of tables with the preceding
-                # table (`after`-variable), so a new tsection begins
-                # at {{ and everything before it belongs to the previous
-                # template.
-
-        texts = []
-        if not template_sections:
-            texts = [text]
-        else:
-            for tsection in template_sections:
-                texts.append("".join(tsection))
+        section_start = 0
+        after_templates = False  # kludge to keep any text
+        # before first template
+        # with the first template;
+        # otherwise, text
+        # goes with preceding template
+        for m in TEMPLATE_BRACES_RE.finditer(text):
+            if text[m.start()] == "{":
+                if template_nesting == 0 and after_templates:
+                    # start new section
+                    texts.append(text[section_start : m.start()])
+                    section_start = m.start()
+                after_templates = True
+                template_nesting += m.end() - m.start()
+            else:
+                template_nesting -= m.end() - m.start()
+                if template_nesting < 0:
+                    wxr.wtp.error(
+                        "Negatively nested braces, "
+                        "couldn't split inflection templates, "
+                        "{}/{} section {}".format(word, language, section),
+                        sortid="page/1871",
+                    )
+                    break
+        # The dangling section, or the whole text if there are no templates.
+        # Why do it this way around? The parser has a preference
+        # to associate bits outside of tables with the preceding
+        # table (`after`-variable), so a new section begins
+        # at {{ and everything before it belongs to the previous
+        # template.
+        texts.append(text[section_start:])
         if template_nesting != 0:
             wxr.wtp.error(
                 "Template nesting error: "
@@ -2324,7 +2411,7 @@ def parse_language(
             # under "forms".
             if wxr.config.capture_inflections:
                 tablecontext = None
-                m = re.search(r"{{([^}{|]+)\|?", text)
+                m = FIRST_TEMPLATE_NAME_RE.search(text)
                 if m:
                     template_name = m.group(1)
                     tablecontext = TableContext(template_name)
@@ -2340,6 +2427,10 @@ def parse_language(
                     tablecontext=tablecontext,
                 )
 
+    # Parsed subpages by title; a subpage may be searched more than once
+    # (e.g., with a shorter section path when the first search fails)
+    subpage_trees: dict[str, WikiNode] = {}
+
     def get_subpage_section(
         title: str, subtitle: str, seq: Union[list[str], tuple[str, ...]]
     ) -> Optional[Union[WikiNode, str]]:
@@ -2353,45 +2444,51 @@ def parse_language(
         for x in seq:
             assert isinstance(x, str)
         subpage_title = word + "/" + subtitle
-        subpage_content = wxr.wtp.get_page_body(subpage_title, 0)
-        if subpage_content is None:
-            wxr.wtp.error(
-                "/translations not found despite "
-                "{{see translation subpage|...}}",
-                sortid="page/1934",
+        tree = subpage_trees.get(subpage_title)
+        if tree is None:
+            subpage_content = wxr.wtp.get_page_body(subpage_title, 0)
+            if subpage_content is None:
+                wxr.wtp.error(
+                    "/translations not found despite "
+                    "{{see translation subpage|...}}",
+                    sortid="page/1934",
+                )
+                return None
+            tree = wxr.wtp.parse(
+                subpage_content,
+                pre_expand=True,
+                additional_expand=ADDITIONAL_EXPAND_TEMPLATES,
+                do_not_pre_expand=DO_NOT_PRE_EXPAND_TEMPLATES,
             )
-            return None
-
-        def recurse(
-            node: Union[str, WikiNode], seq: Union[list[str], tuple[str, ...]]
-        ) -> Optional[Union[str, WikiNode]]:
-            # print(f"seq: {seq}")
+            assert tree.kind == NodeKind.ROOT
+            subpage_trees[subpage_title] = tree
+
+        def find_section(
+            root: WikiNode, seq: Union[list[str], tuple[str, ...]]
+        ) -> Optional[WikiNode]:
+            """Depth-first search for the nested section titles in `seq`,
+            using an explicit stack instead of recursion."""
             if not seq:
-                return node
-            if not isinstance(node, WikiNode):
-                return None
-            # print(f"node.kind: {node.kind}")
-            if node.kind in LEVEL_KINDS:
-                t = clean_node(wxr, None, node.largs[0])
-                # print(f"t: {t} == seq[0]: {seq[0]}?")
-                if t.lower() == seq[0].lower():
-                    seq = seq[1:]
-                    if not seq:
-                        return node
-            for n in node.children:
-                ret = recurse(n, seq)
-                if ret is not None:
-                    return ret
+                return root
+            # Nodes are visited in document order; each is paired with the
+            # lowercased titles still to be found below it
+            stack = [(root, tuple(x.lower() for x in seq))]
+            while stack:
+                node, titles = stack.pop()
+                if node.kind in LEVEL_KINDS:
+                    t = clean_node(wxr, None, node.largs[0])
+                    if t.lower() == titles[0]:
+                        titles = titles[1:]
+                        if not titles:
+                            return node
+                stack.extend(
+                    (n, titles)
+                    for n in reversed(node.children)
+                    if isinstance(n, WikiNode)
+                )
             return None
 
-        tree = wxr.wtp.parse(
-            subpage_content,
-            pre_expand=True,
-            additional_expand=ADDITIONAL_EXPAND_TEMPLATES,
-            do_not_pre_expand=DO_NOT_PRE_EXPAND_TEMPLATES,
-        )
-        assert tree.kind == NodeKind.ROOT
-        ret = recurse(tree, seq)
+        ret = find_section(tree, seq)
         if ret is None:
             wxr.wtp.debug(
                 "Failed to find subpage section {}/{} seq {}".format(
@@ -2417,6 +2514,10 @@ def parse_language(
         have_panel_template = False
         toplevel_text = []
         next_navframe_sense = None  # Used for "(sense):" before NavFrame
+        # Lowercased prefixes of links that are not linkage items
+        ignored_link_prefixes = ns_title_prefix_tuple(
+            wxr, "Category", True
+        ) + ns_title_prefix_tuple(wxr, "File", True)
 
         def parse_linkage_item(
             contents: list[Union[str, WikiNode]],
@@ -2510,10 +2611,7 @@ def parse_language(
                         ignore = False
                         if isinstance(node.largs[0][0], str):
                             v1 = node.largs[0][0].strip().lower()
-                            if v1.startswith(
-                                ns_title_prefix_tuple(wxr, "Category", True)
-                                + ns_title_prefix_tuple(wxr, "File", True)
-                            ):
+                            if v1.startswith(ignored_link_prefixes):
                                 ignore = True
                             if not ignore:
                                 v = node.largs[-1]
@@ -2682,12 +2780,10 @@ def parse_language(
                     if item.kind == NodeKind.TABLE_ROW:
                         cleaned = clean_node(wxr, None, item.children)
                         # print("cleaned:", repr(cleaned))
-                        if any(
-                            [
-                                "Variety" in cleaned,
-                                "Location" in cleaned,
-                                "Words" in cleaned,
-                            ]
+                        if (
+                            "Variety" in cleaned
+                            or "Location" in cleaned
+                            or "Words" in cleaned
                         ):
                             pass
                         else:
@@ -2700,8 +2796,7 @@ def parse_language(
                             tags = []
                             words = split[-1].split(",")
                             for hdr in combined_hdrs:
-                                hdr = hdr.replace("(", ",")
-                                hdr = hdr.replace(")", "")
+                                hdr = hdr.translate(zh_tag_paren_table)
                                 hdr = hdr.replace("N.", "Northern,")
                                 hdr = hdr.replace("S.", "Southern,")
                                 new = hdr.split(",")
@@ -2711,8 +2806,9 @@ def parse_language(
                                     if tag in valid_tags:
                                         tags.append(tag)
                                     else:
-                                        if tag in zh_tag_lookup:
-                                            tags.extend(zh_tag_lookup[tag])
+                                        zh_tags = zh_tag_lookup.get(tag)
+                                        if zh_tags is not None:
+                                            tags.extend(zh_tags)
                                         else:
                                             print(
                                                 f"MISSING ZH SYNONYM TAG for "
@@ -2746,17 +2842,14 @@ def parse_language(
                     if item.kind == NodeKind.LIST_ITEM:
                         cleaned = clean_node(wxr, None, item.children)
                         # print("cleaned:", repr(cleaned))
-                        if any(
-                            [
-                                "Variety" in cleaned,
-                                "Location" in cleaned,
-                                "Words" in cleaned,
-                            ]
+                        if (
+                            "Variety" in cleaned
+                            or "Location" in cleaned
+                            or "Words" in cleaned
                         ):
                             pass
                         else:
-                            cleaned = cleaned.replace("(", ",")
-                            cleaned = cleaned.replace(")", "")
+                            cleaned = cleaned.translate(zh_tag_paren_table)
                             split = cleaned.split(",")
                             # skip empty words / titles
                             if split[0] == "":
@@ -2768,11 +2861,13 @@ def parse_language(
                             for tag in sorted(new_hdrs):
                                 if tag in valid_tags:
                                     tags.append(tag)
-                                elif tag in zh_tag_lookup:
-                                    tags.extend(zh_tag_lookup[tag])
                                 elif (
-                                    classify_desc(tag) == "romanization"
-                                    and roman is None
+                                    zh_tags := zh_tag_lookup.get(tag)
+                                ) is not None:
+                                    tags.extend(zh_tags)
+                                elif (
+                                    roman is None
+                                    and classify_desc(tag) == "romanization"
                                 ):
                                     roman = tag
                                 else:
@@ -2783,16 +2878,18 @@ def parse_language(
                                     )
                                     sys.stdout.flush()
 
-                            for word in words:
-                                dt: LinkageData = {"word": word.strip()}
-                                if tags:
-                                    dt["tags"] = tags
-                                if roman is not None:
-                                    dt["roman"] = roman
-                                data.append(dt)
+                            extra: LinkageData = {}
+                            if tags:
+                                extra["tags"] = tags
+                            if roman is not None:
+                                extra["roman"] = roman
+                            data.extend(
+                                {"word": word.strip(), **extra}
+                                for word in words
+                            )
                     elif item.kind == NodeKind.HTML:
                         cleaned = clean_node(wxr, None, item.children)
-                        if cleaned.find("Synonyms of") >= 0:
+                        if "Synonyms of" in cleaned:
                             cleaned = cleaned.replace("Synonyms of ", "")
                             root_word = cleaned
                         parse_zh_synonyms_list(
@@ -2807,13 +2904,16 @@ def parse_language(
             children: list[Union[WikiNode, str]], nodekind: NodeKind
         ) -> bool:
             assert isinstance(children, list)
-            for item in children:
-                if not isinstance(item, WikiNode):
-                    continue
-                if item.kind == nodekind:
-                    return True
-                elif contains_kind(item.children, nodekind):
-                    return True
+            # Iterative search; the order of the visits does not matter
+            stack = [children]
+            while stack:
+                for item in stack.pop():
+                    if not isinstance(item, WikiNode):
+                        continue
+                    if item.kind == nodekind:
+                        return True
+                    if item.children:
+                        stack.append(item.children)
             return False
 
         # Main body of parse_linkage()
@@ -2881,13 +2981,13 @@ def parse_language(
                 # print("TRANSLATION_ITEM_TEMPLATE_FN:", name, ht)
                 if is_panel_template(wxr, name):
                     return ""
-                if name in ("t+check", "t-check", "t-needed"):
+                if name in translation_ignored_templates:
                     # We ignore these templates.  They seem to have outright
                     # garbage in some entries, and very varying formatting in
                     # others.  These should be transitory and unreliable
                     # anyway.
                     return "__IGNORE__"
-                if name in ("t", "t+", "t-simple", "tt", "tt+"):
+                if name in translation_templates:
                     code = ht.get(1)
                     if code:
                         if langcode and code != langcode:
@@ -2901,7 +3001,14 @@ def parse_language(
                         langcode = code
                     tr = ht.get(2)
                     if tr:
-                        tr = clean_node(wxr, None, [tr])
+                        # Plain words separated by single spaces come out of
+                        # clean_node() unchanged; skip it for them.
+                        if not (
+                            tr.replace(" ", "").isalnum()
+                            and " ".join(tr.split()) == tr
+                            and unicodedata.is_normalized("NFC", tr)
+                        ):
+                            tr = clean_node(wxr, None, [tr])
                         translations_from_template.append(tr)
                     return None
                 if name == "t-egy":
@@ -2917,30 +3024,26 @@ def parse_language(
                         "UNIMPLEMENTED trans-see template", sortid="page/2405"
                     )
                     return ""
-                if name.endswith("-top"):
-                    return ""
-                if name.endswith("-bottom"):
-                    return ""
-                if name.endswith("-mid"):
+                if name.endswith(("-top", "-bottom", "-mid")):
                     return ""
                 # wxr.wtp.debug("UNHANDLED TRANSLATION ITEM TEMPLATE: {!r}"
                 #             .format(name),
                 #          sortid="page/2414")
                 return None
 
-            sublists = list(
-                x
-                for x in contents
-                if isinstance(x, WikiNode) and x.kind == NodeKind.LIST
-            )
-            contents = list(
-                x
-                for x in contents
-                if not isinstance(x, WikiNode) or x.kind != NodeKind.LIST
-            )
+            sublists = []
+            item_contents = []
+            for x in contents:
+                if isinstance(x, WikiNode) and x.kind == NodeKind.LIST:
+                    sublists.append(x)
+                else:
+                    item_contents.append(x)
 
             item = clean_node(
-                wxr, data, contents, template_fn=translation_item_template_fn
+                wxr,
+                data,
+                item_contents,
+                template_fn=translation_item_template_fn,
             )
             # print("    TRANSLATION ITEM: {!r}  [{}]".format(item, sense))
 
@@ -2991,9 +3094,7 @@ def parse_language(
                     sense = None
                     sub = ht.get(1, "")
                     if sub:
-                        m = re.match(
-                            r"\s*(([^:\d]*)\s*\d*)\s*:\s*([^:]*)\s*", sub
-                        )
+                        m = TRANSLATION_SUBPAGE_ARG_RE.match(sub)
                     else:
                         m = None
                     etym = ""
@@ -3067,20 +3168,10 @@ def parse_language(
                         ):
                             parse_translations(data, subnode)
                     return ""
-                if name in (
-                    "c",
-                    "C",
-                    "categorize",
-                    "cat",
-                    "catlangname",
-                    "topics",
-                    "top",
-                    "qualifier",
-                    "cln",
-                ):
+                if name in translation_expanded_templates:
                     # These are expanded in the default way
                     return None
-                if name in ("trans-top",):
+                if name == "trans-top":
                     # XXX capture id from trans-top?  Capture sense here
                     # instead of trying to parse it from expanded content?
                     if ht.get(1):
@@ -3090,13 +3181,6 @@ def parse_language(
                         sense_parts = []
                         sense = None
                     return None
-                if name in (
-                    "trans-bottom",
-                    "trans-mid",
-                    "checktrans-mid",
-                    "checktrans-bottom",
-                ):
-                    return None
                 if name == "checktrans-top":
                     sense_parts = []
                     sense = None
@@ -3194,8 +3278,8 @@ def parse_language(
                         isinstance(arg0, (list, tuple))
                         and arg0
                         and isinstance(arg0[0], str)
-                        and arg0[0].endswith("/" + TRANSLATIONS_TITLE)
-                        and arg0[0][: -(1 + len(TRANSLATIONS_TITLE))]
+                        and arg0[0].endswith(TRANSLATIONS_SUBPAGE_SUFFIX)
+                        and arg0[0][: -len(TRANSLATIONS_SUBPAGE_SUFFIX)]
                         == wxr.wtp.title
                     ):
                         wxr.wtp.debug(
@@ -3265,7 +3349,7 @@ def parse_language(
             nonlocal ignore_count
             if is_panel_template(wxr, name) or name in ["zh-x", "zh-q"]:
                 return ""
-            if re.match(ignored_etymology_templates_re, name):
+            if is_ignored_etymology_template(name):
                 ignore_count += 1
             return None
 
@@ -3278,7 +3362,7 @@ def parse_language(
             if name in wikipedia_templates:
                 parse_wikipedia_template(wxr, data, ht)
                 return None
-            if re.match(ignored_etymology_templates_re, name):
+            if is_ignored_etymology_template(name):
                 ignore_count -= 1
                 return None
             if ignore_count == 0:
@@ -3290,11 +3374,11 @@ def parse_language(
             return None
 
         # Remove any subsections
-        contents = list(
+        contents = [
             x
             for x in node.children
             if not isinstance(x, WikiNode) or x.kind not in LEVEL_KINDS
-        )
+        ]
         # Convert to text, also capturing templates using post_template_fn
         text = clean_node(
             wxr,
@@ -3368,7 +3452,6 @@ def parse_language(
             # thrice-indented. A bare ";" is used to indicate a subtitle-like
             # line with no indentation. ":" at the end of one or more "*"s is
             # used to indicate that the bullet will not be displayed.
-            item_data: DescendantData = {"depth": sarg.count("*")}
             templates: list[TemplateData] = []
             is_derived = False
 
@@ -3383,7 +3466,7 @@ def parse_language(
                     and name not in unignored_non_list_templates
                 ):
                     return ""
-                if re.match(ignored_descendants_templates_re, name):
+                if is_ignored_descendants_template(name):
                     ignore_count += 1
                 return None
 
@@ -3394,7 +3477,7 @@ def parse_language(
                 if name in wikipedia_templates:
                     parse_wikipedia_template(wxr, data, ht)
                     return None
-                if re.match(ignored_descendants_templates_re, name):
+                if is_ignored_descendants_template(name):
                     ignore_count -= 1
                     return None
                 if ignore_count == 0:
@@ -3422,27 +3505,27 @@ def parse_language(
                 template_fn=desc_template_fn,
                 post_template_fn=desc_post_template_fn,
             )
-            item_data["templates"] = templates
-            item_data["text"] = text
+            item_data: DescendantData = {
+                "depth": sarg.count("*"),
+                "templates": templates,
+                "text": text,
+            }
             if is_derived:
                 item_data["tags"] = ["derived"]
             descendants.append(item_data)
 
-        def node_children(node: WikiNode) -> Iterator[tuple[int, WikiNode]]:
-            for i, child in enumerate(node.children):
-                if isinstance(child, WikiNode):
-                    yield (i, child)
-
         def get_sublist_index(list_item: WikiNode) -> Optional[int]:
-            for i, child in node_children(list_item):
-                if child.kind == NodeKind.LIST:
+            for i, child in enumerate(list_item.children):
+                if isinstance(child, WikiNode) and child.kind == NodeKind.LIST:
                     return i
             return None
 
         def get_descendants(node: WikiNode) -> None:
             """Appends the data for every list item in every list in node
             to descendants."""
-            for _, c in node_children(node):
+            for c in node.children:
+                if not isinstance(c, WikiNode):
+                    continue
                 if (
                     c.kind == NodeKind.TEMPLATE
                     and c.largs
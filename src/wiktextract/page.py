@@ -2,6 +2,7 @@
 #
 # Copyright (c) 2018-2022 Tatu Ylonen.  See file LICENSE and https://ylonen.org
 
+import functools
 import re
 from collections import defaultdict
 from copy import copy
@@ -55,10 +56,24 @@ def is_panel_template(wxr: WiktextractContext, template_name: str) -> bool:
     """Checks if `Template_name` is a known panel template name (i.e., one that
     produces an infobox in Wiktionary, but this also recognizes certain other
     templates that we do not wish to expand)."""
-    page_extractor_mod = import_extractor_module(wxr.wtp.lang_code, "page")
-    if template_name in page_extractor_mod.PANEL_TEMPLATES:
+    panel_templates, panel_prefixes = get_panel_templates(wxr.wtp.lang_code)
+    if template_name in panel_templates:
         return True
-    return template_name.startswith(tuple(page_extractor_mod.PANEL_PREFIXES))
+    return template_name.startswith(panel_prefixes)
+
+
+@functools.lru_cache(maxsize=None)
+def get_panel_templates(
+    lang_code: str,
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Returns the panel template names and prefixes of the extractor for
+    `lang_code`.  This is called for almost every template, so the module
+    lookup and the prefix tuple are only computed once per language."""
+    page_extractor_mod = import_extractor_module(lang_code, "page")
+    return (
+        frozenset(page_extractor_mod.PANEL_TEMPLATES),
+        tuple(page_extractor_mod.PANEL_PREFIXES),
+    )
 
 
 def recursively_extract(
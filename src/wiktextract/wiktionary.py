@@ -755,6 +755,10 @@ def reprocess_wiktionary(
     all_page_nums = wxr.wtp.saved_page_nums(
         process_ns_ids, True, "wikitext", search_pattern
     )
+    # Import the extractor before forking so worker processes inherit its
+    # module-level tables instead of importing and building them again.
+    # Workers started with "spawn" still import it once each.
+    import_extractor_module(wxr.wtp.lang_code, "page")
     wxr.remove_unpicklable_objects()
     with Pool(num_processes, init_worker_process, (page_handler, wxr)) as pool:
         wxr.reconnect_databases(False)
@@ -721,9 +721,13 @@ class HeadTests(unittest.TestCase):
 
     def test_head_templates_regex(self):
         # GitHub issue 405
-        from wiktextract.extractor.en.page import HEAD_TAG_RE
+        from wiktextract.extractor.en.page import is_head_template
 
-        self.assertTrue(HEAD_TAG_RE.fullmatch("ru-noun+") is not None)
+        self.assertTrue(is_head_template("ru-noun+"))
+        self.assertTrue(is_head_template("head"))
+        self.assertTrue(is_head_template("ine-pro-noun"))
+        self.assertFalse(is_head_template("ru-noun+x"))
+        self.assertFalse(is_head_template("en-see"))
 
     def test_head36(self):
         self.wxr.wtp.add_page(
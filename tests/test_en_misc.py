@@ -4,7 +4,13 @@
 
 from unittest import TestCase
 
-from wiktextract.extractor.en.page import synch_splits_with_args
+from wiktextract.extractor.en.page import (
+    PANEL_PREFIXES,
+    synch_splits_with_args,
+    template_allowed_pos_map,
+    wikipedia_templates,
+)
+from wiktextract.extractor.en.parts_of_speech import PARTS_OF_SPEECH
 
 
 class MiscTests(TestCase):
@@ -66,3 +72,11 @@ class MiscTests(TestCase):
             {2: "Foo baz", 3: "Bar ― fizz ― fuzz"},
         )
         self.assertEqual(res, ["Foo baz", "Bar ― fizz ― fuzz", "three", "four"])
+
+    def test_panel_prefixes_not_wikipedia_templates(self) -> None:
+        self.assertEqual(PANEL_PREFIXES & wikipedia_templates, set())
+
+    def test_template_allowed_pos_map(self) -> None:
+        for template_name, pos_list in template_allowed_pos_map.items():
+            for pos in pos_list:
+                self.assertIn(pos, PARTS_OF_SPEECH, template_name)
@@ -3,11 +3,12 @@
 # Copyright (c) 2021 Tatu Ylonen.  See file LICENSE and https://ylonen.org
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from wikitextprocessor import Page, Wtp
 
 from wiktextract.config import WiktionaryConfig
+from wiktextract.extractor.en.page import parse_sense_linkage
 from wiktextract.page import parse_page
 from wiktextract.thesaurus import close_thesaurus_db
 from wiktextract.wxr_context import WiktextractContext
@@ -903,3 +904,152 @@ alcance
                 }
             ],
         )
+
+    def test_sense_linkage_parenthesized_alt(self):
+        # Only a final "(...)" that contains no parentheses is an alt
+        self.wxr.wtp.start_page("foo")
+        data = {}
+        parse_sense_linkage(
+            self.wxr,
+            data,
+            "syn",
+            {
+                1: "en",
+                2: "foo (bar)",
+                3: "a (b) (c)",
+                4: "x(y(z))",
+                5: "()",
+                6: ")",
+            },
+        )
+        self.assertEqual(
+            data["synonyms"],
+            [
+                {"word": "foo", "alt": "bar"},
+                {"word": "a (b)", "alt": "c"},
+                {"word": "x(y(z))"},
+                {"word": "()"},
+                {"word": ")"},
+            ],
+        )
+
+    def test_inflection_negatively_nested_braces(self):
+        # The stray "}}" makes splitting the section into templates fail,
+        # so the whole section text is parsed in one go.
+        with patch.object(
+            self.wxr.wtp, "parse", wraps=self.wxr.wtp.parse
+        ) as mock_parse:
+            parse_page(
+                self.wxr,
+                "foo",
+                """
+==Finnish==
+===Noun===
+foo
+
+# sense 1
+
+====Declension====
+{{fi-decl|a}}
+{{fi-decl|b}}}}
+""",
+            )
+        self.assertTrue(
+            any(
+                "Negatively nested braces" in error["msg"]
+                for error in self.wxr.wtp.errors
+            )
+        )
+        inflection_texts = [
+            call.args[0]
+            for call in mock_parse.call_args_list
+            if call.kwargs.get("expand_all") and "fi-decl|b" in call.args[0]
+        ]
+        self.assertEqual(len(inflection_texts), 1)
+        self.assertIn("{{fi-decl|a}}", inflection_texts[0])
+
+    def test_see_translation_subpage_fallback(self):
+        # The subpage has no English/Noun sections, so the lookup is
+        # retried with just "Translations".  The subpage is fetched and
+        # parsed only once for both lookups.
+        self.wxr.wtp.add_page("Template:t", 10, "{{{2}}}")
+        self.wxr.wtp.add_page(
+            "foo/translations",
+            0,
+            """
+====Translations====
+* Finnish: {{t|fi|sana}}
+""",
+        )
+        with (
+            patch.object(
+                self.wxr.wtp,
+                "get_page_body",
+                wraps=self.wxr.wtp.get_page_body,
+            ) as mock_get_page_body,
+            patch.object(
+                self.wxr.wtp, "parse", wraps=self.wxr.wtp.parse
+            ) as mock_parse,
+        ):
+            lst = parse_page(
+                self.wxr,
+                "foo",
+                """
+==English==
+===Noun===
+foo
+
+# gloss
+
+====Translations====
+{{see translation subpage|Noun}}
+""",
+            )
+        self.assertEqual(
+            [
+                mock_call
+                for mock_call in mock_get_page_body.call_args_list
+                if mock_call.args[0] == "foo/translations"
+            ],
+            [call("foo/translations", 0)],
+        )
+        subpage_parses = [
+            mock_call
+            for mock_call in mock_parse.call_args_list
+            if mock_call.kwargs.get("pre_expand")
+            and "sana" in mock_call.args[0]
+        ]
+        self.assertEqual(len(subpage_parses), 1)
+        self.assertEqual(
+            lst[0]["translations"],
+            [{"word": "sana", "lang": "Finnish", "code": "fi"}],
+        )
+
+    def test_translation_template_words(self):
+        # Plain words from {{t}}/{{t+}} are used as is; values with an
+        # entity or a trailing space still go through clean_node()
+        self.wxr.wtp.add_page("Template:t", 10, "{{{2}}}")
+        self.wxr.wtp.add_page("Template:t+", 10, "{{{2}}}")
+        lst = parse_page(
+            self.wxr,
+            "foo",
+            """
+==English==
+===Noun===
+foo
+
+# gloss
+
+====Translations====
+* Finnish: {{t|fi|sana}}, {{t+|fi|kaksi sanaa}}, {{t|fi|ta&#108;o}}, {{t|fi|kissa }}
+""",
+        )
+        self.assertEqual(
+            lst[0]["translations"],
+            [
+                {"word": "sana", "lang": "Finnish", "code": "fi"},
+                {"word": "kaksi sanaa", "lang": "Finnish", "code": "fi"},
+                {"word": "talo", "lang": "Finnish", "code": "fi"},
+                {"word": "kissa", "lang": "Finnish", "code": "fi"},
+            ],
+        )
@@ -7,7 +7,7 @@ import unittest
 from wikitextprocessor import Wtp
 
 from wiktextract.config import WiktionaryConfig
-from wiktextract.datautils import split_slashes
+from wiktextract.datautils import copy_data, split_slashes
 from wiktextract.extractor.share import create_audio_url_dict
 from wiktextract.thesaurus import close_thesaurus_db
 from wiktextract.wxr_context import WiktextractContext
@@ -62,6 +62,20 @@ class UtilsTests(unittest.TestCase):
             ret, ["bar zap a", "bar zap b", "foo zap a", "foo zap b"]
         )
 
+    def test_copy_data(self):
+        data = {
+            "word": "foo",
+            "senses": [{"glosses": ["bar"], "tags": ("baz",)}],
+            "pos_num": 1,
+        }
+        copied = copy_data(data)
+        self.assertEqual(copied, data)
+        self.assertIsNot(copied["senses"], data["senses"])
+        self.assertIsNot(copied["senses"][0], data["senses"][0])
+        self.assertIsNot(
+            copied["senses"][0]["glosses"], data["senses"][0]["glosses"]
+        )
+
     def test_audio_transcode_url(self):
         sound_data = create_audio_url_dict(
             "LL-Q150 (fra)-DenisdeShawi-bonjour.wav \u200e"